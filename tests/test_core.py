@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from workload_parser.core.parser import WorkloadParser, BaseParser, ParserRegistry
 from workload_parser.core.config import ParserConfig
 from workload_parser.core.exceptions import ParsingError, ParserNotFoundError
+from workload_parser.utils.logger import setup_logging
 
 
 class MockParser(BaseParser):
@@ -129,6 +130,56 @@ class TestWorkloadParser(unittest.TestCase):
             self.assertIn('_metadata', result)
         finally:
             Path(temp_path).unlink()
+    
+    def test_parse_directory_parallel_matches_serial(self):
+        """Test that parsing with worker processes keeps results and order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(3):
+                (Path(temp_dir) / f"run{index}_output.txt").write_text(f"Event: Start {index}\n")
+            
+            # A SocWatch session folder, routed to the CSV table parser
+            socwatch_dir = Path(temp_dir) / "socwatch"
+            socwatch_dir.mkdir()
+            for session in ("extraSession", "hwSession", "infoSession", "osSession"):
+                (socwatch_dir / f"workload_{session}.etl").touch()
+            (socwatch_dir / "workload.csv").write_text(
+                "Core C-State Summary: Residency (Percentage and Time)\n"
+                "State,Residency (%)\n"
+                "C0,10.5\n"
+                "C6,89.5\n"
+            )
+            
+            serial = self.parser.parse_directory(temp_dir)
+            parallel = self.parser.parse_directory(temp_dir, max_workers=2)
+        
+        parser_names = [result['_metadata']['parser_name'] for result in serial]
+        self.assertEqual(parser_names.count('etl'), 3)
+        self.assertIn('socwatch', parser_names)
+        self.assertEqual(parallel, serial)
+    
+    def test_parse_directory_parallel_log_file(self):
+        """Test that worker log records reach the log file exactly once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir) / "data"
+            data_dir.mkdir()
+            for index in range(4):
+                (data_dir / f"run{index}_output.txt").write_text(f"Event: Start {index}\n")
+            
+            log_file = Path(temp_dir) / "parser.log"
+            config = ParserConfig()
+            config.update_config({'logging': {'level': 'INFO', 'console': False, 'file_path': str(log_file)}})
+            parser = WorkloadParser(config=config)
+            try:
+                parser.logger.info("before pool marker")
+                results = parser.parse_directory(str(data_dir), max_workers=2)
+                log_text = log_file.read_text(encoding='utf-8')
+            finally:
+                setup_logging({'console': False})
+        
+        self.assertEqual(len(results), 4)
+        self.assertEqual(log_text.count("before pool marker"), 1)
+        for index in range(4):
+            self.assertEqual(log_text.count(f"Successfully parsed {data_dir / f'run{index}_output.txt'}"), 1)
 
 
 if __name__ == '__main__':
@@ -69,6 +69,10 @@ class TestPCIeParser:
         # Should NOT detect as PCIe-only file
         assert parser.can_parse(csv_file) is False
     
+    def test_cannot_parse_missing_folder(self, parser, tmp_path):
+        """Test that a CSV path in a folder that does not exist is rejected."""
+        assert parser.can_parse(tmp_path / "missing" / "workload.csv") is False
+    
     def test_parse_pcie_lpm_data(self, parser, tmp_path):
         """Test parsing of PCIe LPM residency data."""
         # Create test directory structure
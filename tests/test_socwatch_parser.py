@@ -0,0 +1,239 @@
+"""
+Tests for the full SocWatch parser
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+from workload_parser.parsers.socwatch_parser import SocwatchParser, _find_lookup_offsets, _read_table_block
+
+
+_CSTATE_CSV = (
+    "Core C-State Summary\n"
+    "State,Residency (%)\n"
+    "C0,10.5\n"
+    "C6,89.5\n"
+    "\n"
+    "Package C-State Summary\n"
+    "State,Residency (%)\n"
+    "PC0,20.0\n"
+    "PC6,80.0\n"
+)
+
+
+def _write_targets_config(config_file: Path, keys, mtime: float) -> None:
+    """Write an enhanced config with the given C-state targets and pin its mtime."""
+    lookups = {"Core_Cstate": "Core C-State Summary", "PKG_Cstate": "Package C-State Summary"}
+    targets = [{"key": key, "lookup": lookups[key]} for key in keys]
+    config_file.write_text(json.dumps({"socwatch_targets": targets}))
+    os.utime(config_file, (mtime, mtime))
+
+
+def _make_socwatch_folder(workload_dir: Path, prefix: str = "workload", os_session: bool = True) -> None:
+    """Create the SocWatch session ETL files for a workload folder."""
+    workload_dir.mkdir()
+    sessions = ["extraSession", "hwSession", "infoSession"]
+    if os_session:
+        sessions.append("osSession")
+    for session in sessions:
+        (workload_dir / f"{prefix}_{session}.etl").touch()
+
+
+class TestSocwatchParser:
+    """Test cases for full SocWatch data parsing."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create a SocwatchParser instance."""
+        return SocwatchParser()
+
+    def test_can_parse_full_socwatch(self, parser, tmp_path):
+        """Test detection of SocWatch files with all four session ETLs."""
+        workload_dir = tmp_path / "full_socwatch"
+        _make_socwatch_folder(workload_dir)
+
+        csv_file = workload_dir / "workload.csv"
+        csv_file.write_text("Core C-State Summary\n")
+
+        assert parser.can_parse(csv_file) is True
+
+    def test_cannot_parse_without_os_session(self, parser, tmp_path):
+        """Test that PCIe-only folders (no osSession) are rejected."""
+        workload_dir = tmp_path / "pcie_only"
+        _make_socwatch_folder(workload_dir, os_session=False)
+
+        csv_file = workload_dir / "workload.csv"
+        csv_file.write_text("PCIe LPM Summary\n")
+
+        assert parser.can_parse(csv_file) is False
+
+    def test_cannot_parse_other_prefix(self, parser, tmp_path):
+        """Test that CSV files not matching the workload prefix are rejected."""
+        workload_dir = tmp_path / "other_prefix"
+        _make_socwatch_folder(workload_dir)
+
+        csv_file = workload_dir / "summary.csv"
+        csv_file.write_text("Unrelated data\n")
+
+        assert parser.can_parse(csv_file) is False
+
+    def test_rescans_folder_after_change(self, parser, tmp_path):
+        """Test that the cached ETL inventory is refreshed when the folder changes."""
+        workload_dir = tmp_path / "late_os_session"
+        _make_socwatch_folder(workload_dir, os_session=False)
+
+        csv_file = workload_dir / "workload.csv"
+        csv_file.write_text("Core C-State Summary\n")
+        assert parser.can_parse(csv_file) is False
+
+        # Adding the osSession trace bumps the folder mtime
+        (workload_dir / "workload_osSession.etl").touch()
+        mtime = workload_dir.stat().st_mtime + 10
+        os.utime(workload_dir, (mtime, mtime))
+
+        assert parser.can_parse(csv_file) is True
+
+    def test_cannot_parse_wakeup_analysis(self, parser, tmp_path):
+        """Test that WakeupAnalysis files are skipped."""
+        workload_dir = tmp_path / "wakeups"
+        _make_socwatch_folder(workload_dir)
+
+        csv_file = workload_dir / "workload_WakeupAnalysis.csv"
+        csv_file.write_text("Wakeup data\n")
+
+        assert parser.can_parse(csv_file) is False
+
+    def test_mixed_workload_folder_picks_complete_workload(self, parser, tmp_path):
+        """Test that a folder with several workloads resolves to the one with the most sessions."""
+        workload_dir = tmp_path / "mixed"
+        _make_socwatch_folder(workload_dir, prefix="beta")
+        for session in ["extraSession", "hwSession", "infoSession"]:
+            (workload_dir / f"alpha_{session}.etl").touch()
+
+        for name in ["alpha.csv", "beta.csv"]:
+            (workload_dir / name).write_text("Core C-State Summary\n")
+
+        assert parser.can_parse(workload_dir / "beta.csv") is True
+        assert parser.can_parse(workload_dir / "alpha.csv") is False
+
+    def test_mixed_workload_folder_tie_is_alphabetical(self, parser, tmp_path):
+        """Test that workloads with equally many sessions resolve to the first prefix by name."""
+        workload_dir = tmp_path / "tie"
+        _make_socwatch_folder(workload_dir, prefix="beta")
+        for session in ["extraSession", "hwSession", "infoSession", "osSession"]:
+            (workload_dir / f"alpha_{session}.etl").touch()
+
+        for name in ["alpha.csv", "beta.csv"]:
+            (workload_dir / name).write_text("Core C-State Summary\n")
+
+        assert parser.can_parse(workload_dir / "alpha.csv") is True
+        assert parser.can_parse(workload_dir / "beta.csv") is False
+
+    def test_cannot_parse_missing_folder(self, parser, tmp_path):
+        """Test that a CSV path in a folder that does not exist is rejected."""
+        assert parser.can_parse(tmp_path / "missing" / "workload.csv") is False
+
+    def test_repeat_parse_returns_independent_copy(self, parser, tmp_path):
+        """Test that mutating a parse result does not leak into cached results."""
+        workload_dir = tmp_path / "repeat_parse"
+        _make_socwatch_folder(workload_dir)
+
+        csv_file = workload_dir / "workload.csv"
+        csv_file.write_text("Unrelated data\n")
+
+        first = parser.parse(csv_file)
+        first['socwatch_data']['injected'] = 1
+
+        second = SocwatchParser().parse(csv_file)
+        assert 'injected' not in second['socwatch_data']
+
+    def test_repeat_parse_follows_target_config_edits(self, parser, tmp_path, monkeypatch):
+        """Test that a cached parse is refreshed when the targets config changes."""
+        workload_dir = tmp_path / "config_edit"
+        _make_socwatch_folder(workload_dir)
+        csv_file = workload_dir / "workload.csv"
+        csv_file.write_text(_CSTATE_CSV)
+
+        (tmp_path / "config").mkdir()
+        config_file = tmp_path / "config" / "enhanced_parser_config.json"
+        monkeypatch.chdir(tmp_path)
+
+        _write_targets_config(config_file, ["Core_Cstate", "PKG_Cstate"], 1_000_000)
+        first = parser.parse(csv_file)['socwatch_data']
+        assert any(key.endswith("PKG_Cstate") for key in first)
+
+        _write_targets_config(config_file, ["Core_Cstate"], 2_000_000)
+        second = parser.parse(csv_file)['socwatch_data']
+        assert any(key.endswith("Core_Cstate") for key in second)
+        assert not any(key.endswith("PKG_Cstate") for key in second)
+
+    def test_repeat_parse_uses_subclass_overrides(self, parser, tmp_path):
+        """Test that cached parses run on the calling instance, not a rebuilt SocwatchParser."""
+        class TaggedParser(SocwatchParser):
+            def __init__(self, tag, report_dir):
+                super().__init__({'report_dir': report_dir})
+                self.tag = tag
+
+            def _extract_target_metrics(self, socwatch_tables):
+                return {self.tag: type(self.config['report_dir']).__name__}
+
+        workload_dir = tmp_path / "subclass"
+        _make_socwatch_folder(workload_dir)
+        csv_file = workload_dir / "workload.csv"
+        csv_file.write_text(_CSTATE_CSV)
+
+        parser.parse(csv_file)
+        tagged = TaggedParser('tagged', tmp_path).parse(csv_file)['socwatch_data']
+        assert tagged == {'tagged': type(tmp_path).__name__}
+
+    def test_find_lookup_offsets_overlapping(self):
+        """Test that overlapping lookup texts resolve to their first matching line."""
+        lines = [
+            "header",
+            "Core C-State Summary: Residency",
+            "data",
+            "Core C-State",
+            "Package C-State Summary",
+        ]
+        lookups = ["Core C-State", "Core C-State Summary: Residency", "C-State Summary", "Missing"]
+
+        assert _find_lookup_offsets("\n".join(lines), lookups) == {
+            "Core C-State": 7,
+            "Core C-State Summary: Residency": 7,
+            "C-State Summary": 7,
+        }
+
+    def test_find_lookup_offsets_masked_and_last_line(self):
+        """Test lookups hidden inside a longer match and on an unterminated last line."""
+        content = "Package C-State Summary\n\nPCIe LPM Summary"
+        lookups = ["Package C-State Summary", "C-State", "PCIe LPM Summary"]
+
+        assert _find_lookup_offsets(content, lookups) == {
+            "Package C-State Summary": 0,
+            "C-State": 0,
+            "PCIe LPM Summary": 25,
+        }
+
+    def test_read_table_block_from_offset(self):
+        """Test that a table is read from the line after the lookup up to the next blank line."""
+        content = "intro\nCore C-State Summary\nState,Residency\n-----,---------\nC0,\"12.5\"\r\n\nC6,80"
+
+        assert _read_table_block(content, 6) == [["State", "Residency"], ["C0", "12.5"]]
+        assert _read_table_block("Core C-State Summary", 0) == []
+
+    def test_read_table_block_stray_quote_stays_on_its_line(self):
+        """Test that an unmatched quote does not merge the following rows into one cell."""
+        content = "OS Wakeups\n\"proc (12),5.0\nC6,80\nC7,10"
+
+        assert _read_table_block(content, 0) == [["proc (12)", "5.0"], ["C6", "80"], ["C7", "10"]]
+
+    def test_read_table_block_keeps_empty_quoted_cells(self):
+        """Test that an empty quoted cell keeps its position while unquoted empty cells are dropped."""
+        content = 'Core Frequency\nCPU/Core_0,"",1,2,45.2\n"Core, P",,"3"'
+
+        assert _read_table_block(content, 0) == [["CPU/Core_0", "", "1", "2", "45.2"], ["Core, P", "3"]]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
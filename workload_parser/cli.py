@@ -47,6 +47,8 @@ def simple_cli():
     parser.add_argument("-o", "--output", help="Output file path (JSON format)")
     parser.add_argument("-r", "--recursive", action="store_true", 
                        help="Parse directory recursively")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                       help="Number of worker processes for directory parsing")
     parser.add_argument("-v", "--verbose", action="store_true", 
                        help="Verbose output")
     
@@ -62,7 +64,7 @@ def simple_cli():
         if input_path.is_file():
             results = [workload_parser.parse_file(str(input_path))]
         elif input_path.is_dir():
-            results = workload_parser.parse_directory(str(input_path), args.recursive)
+            results = workload_parser.parse_directory(str(input_path), args.recursive, args.workers)
         else:
             print(f"Error: Input path does not exist: {args.input_path}")
             return 1
@@ -105,10 +107,12 @@ if CLICK_AVAILABLE:
                   help='Output file path (JSON format)')
     @click.option('-r', '--recursive', is_flag=True, 
                   help='Parse directory recursively')
+    @click.option('-j', '--workers', type=int, default=None,
+                  help='Number of worker processes for directory parsing')
     @click.option('-v', '--verbose', is_flag=True, 
                   help='Verbose output')
     def cli_main(input_path: str, config: Optional[str], output: Optional[str], 
-                 recursive: bool, verbose: bool):
+                 recursive: bool, workers: Optional[int], verbose: bool):
         """Workload Parser - Parse and analyze workload data."""
         try:
             # Initialize parser
@@ -120,7 +124,7 @@ if CLICK_AVAILABLE:
             if input_path_obj.is_file():
                 results = [workload_parser.parse_file(input_path)]
             else:
-                results = workload_parser.parse_directory(input_path, recursive)
+                results = workload_parser.parse_directory(input_path, recursive, workers)
             
             # Output results
             if output:
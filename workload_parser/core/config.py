@@ -52,6 +52,10 @@ class ParserConfig:
             parser_config.setdefault('options', {})['pcie_targets'] = self.get_pcie_targets()
         elif parser_name == 'hobl':
             parser_config.setdefault('options', {})['hobl_enabled'] = self.is_hobl_enabled()
+        elif parser_name in ('pacs', 'generic_csv'):
+            # Row-level raw data is only exported when the output config asks for it
+            include_raw_data = self.get_output_config().get('include_raw_data', False)
+            parser_config.setdefault('options', {})['include_raw_data'] = include_raw_data
         
         return parser_config
     
@@ -172,7 +172,7 @@ class ConfigurationManager:
         
         # Migrate DAQ targets
         for key, value in old_data.items():
-            if key.startswith('P_') or key.startswith('V_') or key.startswith('I_'):
+            if key.startswith(('P_', 'V_', 'I_')):
                 migrated['daq_targets'][key] = {
                     'name': key,
                     'default_value': value if isinstance(value, (int, float)) else -1,
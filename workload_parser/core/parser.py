@@ -13,6 +13,10 @@ Features:
 """
 
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Type
 from abc import ABC, abstractmethod
@@ -105,14 +109,18 @@ class WorkloadParser:
     Args:
         config_path: Path to configuration JSON file (optional)
         config: Pre-configured ParserConfig instance (optional)
+        configure_logging: Set up root logging from the config (default True);
+            off when the process already has its handlers
     """
     
-    def __init__(self, config_path: Optional[str] = None, config: Optional[ParserConfig] = None):
+    def __init__(self, config_path: Optional[str] = None, config: Optional[ParserConfig] = None,
+                 configure_logging: bool = True):
         # Load configuration
         self.config = config or ParserConfig(config_path)
         
         # Setup logging
-        setup_logging(self.config.logging_config)
+        if configure_logging:
+            setup_logging(self.config.logging_config)
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # Initialize parser registry
@@ -202,8 +210,15 @@ class WorkloadParser:
             self.logger.error(error_msg)
             raise ParsingError(error_msg, str(path))
     
-    def parse_directory(self, directory_path: str, recursive: bool = True) -> List[Dict[str, Any]]:
-        """Parse all compatible files in a directory."""
+    def parse_directory(self, directory_path: str, recursive: bool = True,
+                        max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse all compatible files in a directory.
+        
+        Files are independent, so with max_workers > 1 they are parsed in a
+        pool of worker processes. Results keep the directory listing order
+        either way.
+        """
         dir_path = Path(directory_path)
         
         if not dir_path.exists():
@@ -223,22 +238,43 @@ class WorkloadParser:
         
         self.logger.info(f"Found {len(all_files)} files in {directory_path}")
         
-        for file_path in all_files:
-            try:
-                result = self.parse_file(str(file_path))
-                results.append(result)
-            except ParsingError as e:
-                self.logger.warning(f"Skipping file due to parsing error: {e}")
-                errors.append({
-                    'file_path': str(file_path),
-                    'error': str(e)
-                })
-            except Exception as e:
-                self.logger.error(f"Unexpected error parsing {file_path}: {e}")
-                errors.append({
-                    'file_path': str(file_path),
-                    'error': f"Unexpected error: {str(e)}"
-                })
+        # Each worker builds its own parser once from the config and registry;
+        # leaving the block shuts the pool down even if an exception escapes.
+        # Forked workers inherit the logging handlers, spawned ones set them up.
+        if max_workers and max_workers > 1 and len(all_files) > 1:
+            mp_context = multiprocessing.get_context()
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=mp_context,
+                initializer=_init_parse_worker,
+                initargs=(self.config, self.registry, mp_context.get_start_method() != 'fork')
+            )
+        else:
+            pool = nullcontext()
+        
+        with pool as executor:
+            if executor is not None:
+                futures = [executor.submit(_parse_file_in_worker, str(file_path)) for file_path in all_files]
+                parse_calls = [future.result for future in futures]
+            else:
+                parse_calls = [partial(self.parse_file, str(file_path)) for file_path in all_files]
+            
+            for file_path, parse_call in zip(all_files, parse_calls):
+                try:
+                    result = parse_call()
+                    results.append(result)
+                except ParsingError as e:
+                    self.logger.warning(f"Skipping file due to parsing error: {e}")
+                    errors.append({
+                        'file_path': str(file_path),
+                        'error': str(e)
+                    })
+                except Exception as e:
+                    self.logger.error(f"Unexpected error parsing {file_path}: {e}")
+                    errors.append({
+                        'file_path': str(file_path),
+                        'error': f"Unexpected error: {str(e)}"
+                    })
         
         self.logger.info(f"Successfully parsed {len(results)} files, {len(errors)} errors")
         
@@ -253,4 +289,20 @@ class WorkloadParser:
             'available_parsers': self.registry.get_available_parsers(),
             'enabled_parsers': self.config.get_enabled_parsers(),
             'config_loaded': self.config is not None
-        }
\ No newline at end of file
+        }
+
+
+# Parser owned by a parse_directory worker process, built once by _init_parse_worker
+_worker_parser: Optional[WorkloadParser] = None
+
+
+def _init_parse_worker(config: ParserConfig, registry: ParserRegistry, configure_logging: bool) -> None:
+    """Set up a worker process with the parent's configuration and parser registry."""
+    global _worker_parser
+    _worker_parser = WorkloadParser(config=config, configure_logging=configure_logging)
+    _worker_parser.registry = registry
+
+
+def _parse_file_in_worker(file_path: str) -> Dict[str, Any]:
+    """Parse a single file in a worker process."""
+    return _worker_parser.parse_file(file_path)
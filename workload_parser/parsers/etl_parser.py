@@ -25,6 +25,40 @@ from ..core.parser import BaseParser
 from ..core.exceptions import ParsingError
 
 
+# ETL filename patterns (from old project), matched against lowercased names
+_ETL_FILENAME_RE = re.compile(r'\.etl$|etl.*\.txt|_output\.txt')
+
+# Model output filename patterns (from old project), matched against lowercased names
+_MODEL_OUTPUT_FILENAME_RE = re.compile(r'_qdq_proxy_|model.*output|inference.*output')
+
+# Timestamp formats tried in order on each line; the first pattern that matches wins
+_TIMESTAMP_PATTERNS = (
+    re.compile(r'(\\d{13})'),  # 13-digit millisecond epoch
+    re.compile(r'(\\d{10})'),  # 10-digit second epoch
+    re.compile(r'(\\d+\\.\\d+)'),  # Decimal timestamp
+    re.compile(r'(\\d{4}-\\d{2}-\\d{2}[T\\s]\\d{2}:\\d{2}:\\d{2})'),  # ISO format
+)
+
+# Event name patterns tried in order on each line
+_EVENT_PATTERNS = (
+    re.compile(r'Event[:\\s]+(\\w+)', re.IGNORECASE),
+    re.compile(r'(\\w+)\\s+Event', re.IGNORECASE),
+    re.compile(r'Task[:\\s]+(\\w+)', re.IGNORECASE),
+    re.compile(r'Process[:\\s]+(\\w+)', re.IGNORECASE),
+)
+
+# 13-digit millisecond epochs, scanned for the first in-range event time
+_EPOCH_RE = re.compile(r'(\\d{13})')
+
+# Model output throughput formats tried in order; the first with matches wins
+_THROUGHPUT_PATTERNS = (
+    re.compile(r'throughput[:\\s]+([\\d\\.]+)', re.IGNORECASE),
+    re.compile(r'fps[:\\s]+([\\d\\.]+)', re.IGNORECASE),
+    re.compile(r'frames[\\s]+per[\\s]+second[:\\s]+([\\d\\.]+)', re.IGNORECASE),
+    re.compile(r'([\\d\\.]+)[\\s]+fps', re.IGNORECASE),
+)
+
+
 class ETLParser(BaseParser):
     """Enhanced parser for ETL (Event Trace Log) files."""
     
@@ -41,17 +75,12 @@ class ETLParser(BaseParser):
         
         # Check filename patterns (from old project)
         filename_lower = file_path.name.lower()
-        etl_patterns = [
-            r'.*\.etl$',
-            r'.*etl.*\.txt',
-            r'.*_output\.txt',
-        ]
         
         # Exclude socwatch ETL files
         if 'session.etl' in filename_lower:
             return False
             
-        return any(re.match(pattern, filename_lower) for pattern in etl_patterns)
+        return _ETL_FILENAME_RE.search(filename_lower) is not None
     
     def parse(self, file_path: Path) -> Dict[str, Any]:
         """Parse ETL file and extract timing information."""
@@ -152,15 +181,8 @@ class ETLParser(BaseParser):
     def _extract_timestamp(self, line: str) -> Optional[float]:
         """Extract timestamp from a line."""
         # Look for various timestamp formats
-        timestamp_patterns = [
-            r'(\\d{13})',  # 13-digit millisecond epoch
-            r'(\\d{10})',  # 10-digit second epoch
-            r'(\\d+\\.\\d+)',  # Decimal timestamp
-            r'(\\d{4}-\\d{2}-\\d{2}[T\\s]\\d{2}:\\d{2}:\\d{2})',  # ISO format
-        ]
-        
-        for pattern in timestamp_patterns:
-            match = re.search(pattern, line)
+        for pattern in _TIMESTAMP_PATTERNS:
+            match = pattern.search(line)
             if match:
                 try:
                     timestamp_str = match.group(1)
@@ -183,15 +205,8 @@ class ETLParser(BaseParser):
     def _extract_event_info(self, line: str) -> Optional[Dict[str, Any]]:
         """Extract event information from a line."""
         # Look for common event patterns
-        event_patterns = [
-            r'Event[:\\s]+(\\w+)',
-            r'(\\w+)\\s+Event',
-            r'Task[:\\s]+(\\w+)',
-            r'Process[:\\s]+(\\w+)',
-        ]
-        
-        for pattern in event_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in _EVENT_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return {
                     'event_name': match.group(1),
@@ -244,8 +259,7 @@ class ETLParser(BaseParser):
     def _find_first_event_epoch(self, content: str) -> Optional[int]:
         """Find first event epoch timestamp (from old project)."""
         # Look for 13-digit epoch timestamps
-        epoch_pattern = r'(\\d{13})'
-        matches = re.findall(epoch_pattern, content)
+        matches = _EPOCH_RE.findall(content)
         
         if matches:
             for match in matches:
@@ -285,13 +299,7 @@ class ModelOutputParser(BaseParser):
         filename_lower = file_path.name.lower()
         
         # Check for model output patterns (from old project)
-        model_patterns = [
-            r'.*_qdq_proxy_.*',
-            r'.*model.*output.*',
-            r'.*inference.*output.*',
-        ]
-        
-        return any(re.match(pattern, filename_lower) for pattern in model_patterns)
+        return _MODEL_OUTPUT_FILENAME_RE.search(filename_lower) is not None
     
     def parse(self, file_path: Path) -> Dict[str, Any]:
         """Parse model output file."""
@@ -353,15 +361,8 @@ class ModelOutputParser(BaseParser):
     def _extract_throughput(self, content: str) -> Optional[List[float]]:
         """Extract throughput values from model output."""
         # Look for common throughput patterns
-        throughput_patterns = [
-            r'throughput[:\\s]+([\\d\\.]+)',
-            r'fps[:\\s]+([\\d\\.]+)',
-            r'frames[\\s]+per[\\s]+second[:\\s]+([\\d\\.]+)',
-            r'([\\d\\.]+)[\\s]+fps',
-        ]
-        
-        for pattern in throughput_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _THROUGHPUT_PATTERNS:
+            matches = pattern.findall(content)
             if matches:
                 try:
                     return [float(match) for match in matches]
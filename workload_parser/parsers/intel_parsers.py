@@ -2,15 +2,53 @@
 Intel workload-specific parsers.
 """
 
+import importlib.util
+import logging
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import pandas as pd
 
 from ..core.parser import BaseParser
 from ..core.exceptions import ParsingError
 
 
+# pyarrow is optional; its multithreaded CSV reader is used only when requested
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# PACS filename patterns (pacs, config/configuration/summary/traces CSVs)
+_PACS_FILENAME_RE = re.compile(r'pacs|config.*\.csv|summary.*\.csv|traces.*\.csv', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _is_pacs_filename(name: str) -> bool:
+    """Classify a filename as PACS data, memoized per name across parser instances."""
+    return _PACS_FILENAME_RE.search(name) is not None
+
+
+@lru_cache(maxsize=None)
+def _warn_pyarrow_missing() -> None:
+    """Log the missing-pyarrow fallback once per process rather than once per parser instance."""
+    logging.getLogger('PacsParser').warning("pyarrow is not installed, using the C CSV engine")
+
+
+def _export_raw_data(df: pd.DataFrame, raw_format: str) -> Optional[Any]:
+    """
+    Export DataFrame contents for the raw_data result field.
+    
+    'records' builds one dict per row, 'columns' one list per column (far fewer
+    Python objects on long files) and 'none' skips the export entirely.
+    """
+    if raw_format == 'records':
+        return df.to_dict('records')
+    if raw_format == 'columns':
+        return df.to_dict('list')
+    if raw_format == 'none':
+        return None
+    raise ParsingError(f"Unknown raw_format '{raw_format}' (expected 'records', 'columns' or 'none')")
+
+
 class PacsParser(BaseParser):
     """Parser for PACS (Power Analysis and Control System) data files."""
     
@@ -19,6 +57,20 @@ class PacsParser(BaseParser):
         self.delimiter = self.config.get('delimiter', ',')
         self.skip_rows = self.config.get('skip_rows', 0)
         self.encoding = self.config.get('encoding', 'utf-8')
+        self.raw_format = self.config.get(
+            'raw_format', 'records' if self.config.get('include_raw_data', True) else 'none'
+        )
+        self.csv_engine = self.config.get('csv_engine', 'c')
+        if self.csv_engine == 'pyarrow' and not PYARROW_AVAILABLE:
+            _warn_pyarrow_missing()
+            self.csv_engine = 'c'
+        
+        # The pyarrow engine reads in one pass and does not accept low_memory;
+        # keeping Arrow-backed dtypes skips the conversion to numpy/object arrays
+        if self.csv_engine == 'pyarrow':
+            self._read_options = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+        else:
+            self._read_options = {'engine': self.csv_engine, 'low_memory': False}
         
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle the given file."""
@@ -27,16 +79,7 @@ class PacsParser(BaseParser):
             return False
         
         # Check filename patterns for PACS files
-        filename_lower = file_path.name.lower()
-        pacs_patterns = [
-            r'.*pacs.*',
-            r'.*configuration.*\.csv',
-            r'.*config.*\.csv',
-            r'.*summary.*\.csv',
-            r'.*traces.*\.csv'
-        ]
-        
-        return any(re.match(pattern, filename_lower) for pattern in pacs_patterns)
+        return _is_pacs_filename(file_path.name)
     
     def parse(self, file_path: Path) -> Dict[str, Any]:
         """Parse PACS data file."""
@@ -49,7 +92,7 @@ class PacsParser(BaseParser):
                     delimiter=self.delimiter,
                     skiprows=self.skip_rows,
                     encoding=self.encoding,
-                    low_memory=False
+                    **self._read_options
                 )
             except Exception:
                 # If that fails, try with different delimiters
@@ -60,7 +103,7 @@ class PacsParser(BaseParser):
                             delimiter=delimiter,
                             skiprows=self.skip_rows,
                             encoding=self.encoding,
-                            low_memory=False
+                            **self._read_options
                         )
                         if len(df.columns) > 1:  # Found a good delimiter
                             break
@@ -74,14 +117,14 @@ class PacsParser(BaseParser):
                 raise ParsingError(f"Empty data file: {file_path}")
             
             # Clean column names
-            df.columns = df.columns.str.strip()
+            df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
             
             # Prepare result
             result = {
                 'pacs_data': {
                     'columns': list(df.columns),
                     'row_count': len(df),
-                    'raw_data': df.to_dict('records')
+                    'raw_data': _export_raw_data(df, self.raw_format)
                 },
                 'file_info': {
                     'path': str(file_path)
@@ -159,6 +202,9 @@ class GenericCsvParser(BaseParser):
         self.delimiter = self.config.get('delimiter', ',')
         self.skip_rows = self.config.get('skip_rows', 0)
         self.encoding = self.config.get('encoding', 'utf-8')
+        self.raw_format = self.config.get(
+            'raw_format', 'records' if self.config.get('include_raw_data', True) else 'none'
+        )
         
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle the given file."""
@@ -213,7 +259,7 @@ class GenericCsvParser(BaseParser):
                 }
             
             # Clean column names
-            df.columns = df.columns.str.strip()
+            df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
             
             # Determine data type based on filename
             filename_lower = file_path.name.lower()
@@ -234,7 +280,7 @@ class GenericCsvParser(BaseParser):
                     'columns': list(df.columns),
                     'row_count': len(df),
                     'parsing_info': f'Parsed with delimiter={used_delimiter}, encoding={used_encoding}',
-                    'raw_data': df.to_dict('records')
+                    'raw_data': _export_raw_data(df, self.raw_format)
                 },
                 'file_info': {
                     'path': str(file_path)
@@ -5,14 +5,40 @@ Based on the original power_summary_parser.py but with modern architecture.
 
 import re
 import csv
+import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
 
 from ..core.parser import BaseParser
 from ..core.exceptions import ParsingError
 
 
+# Power summary filename patterns (from old project)
+_POWER_FILENAME_RE = re.compile(r'power|pacs-summary|pwr|energy|watt|daq', re.IGNORECASE)
+
+# Rails summed into the derived P_SOC+MEMORY metric
+_SOC_COMPONENTS = ('P_VCC_PCORE', 'P_VCC_ECORE', 'P_VCCSA', 'P_VCCGT')
+_MEMORY_COMPONENTS = ('P_VDDQ', 'P_VDD2H', 'P_VDD2L')
+
+# Power trace filename patterns, including sample rate files
+_TRACE_FILENAME_RE = re.compile(r'pacs-traces|trace.*\.csv|_sr\.csv', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _is_power_filename(name: str) -> bool:
+    """Classify a filename as power summary data; cached since dispatch re-checks every file."""
+    return _POWER_FILENAME_RE.search(name) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_trace_filename(name: str) -> bool:
+    """Classify a filename as power trace data."""
+    return _TRACE_FILENAME_RE.search(name) is not None
+
+
 class PowerParser(BaseParser):
     """Enhanced parser for power consumption data files with DAQ target support."""
     
@@ -31,30 +57,30 @@ class PowerParser(BaseParser):
             return False
         
         # Check filename patterns (from old project)
-        filename_lower = file_path.name.lower()
-        power_patterns = [
-            r'.*power.*summary.*',
-            r'.*pacs-summary.*',
-            r'.*power.*',
-            r'.*pwr.*',
-            r'.*energy.*',
-            r'.*watt.*',
-            r'.*daq.*'
-        ]
-        
-        return any(re.match(pattern, filename_lower) for pattern in power_patterns)
+        return _is_power_filename(file_path.name)
     
     def parse(self, file_path: Path) -> Dict[str, Any]:
         """Parse power data file with DAQ target mapping."""
         try:
             self.logger.info(f"Parsing power file: {file_path}")
             
+            # Probe the header so only the rail name and average columns are parsed
+            columns = pd.read_csv(
+                file_path,
+                delimiter=self.delimiter,
+                skiprows=self.skip_rows,
+                encoding='utf-8-sig',
+                nrows=0
+            ).columns
+            usecols = [columns[0], self.average_column] if self.average_column in columns else None
+            
             # Read the CSV file with UTF-8 BOM handling (from old project)
             df = pd.read_csv(
                 file_path,
                 delimiter=self.delimiter,
                 skiprows=self.skip_rows,
                 encoding='utf-8-sig',  # Handle BOM
+                usecols=usecols,
                 low_memory=False
             )
             
@@ -93,17 +119,16 @@ class PowerParser(BaseParser):
         from collections import OrderedDict
         power_data = OrderedDict()
         
-        # Convert DataFrame to dictionary for easier searching
-        rows_dict = {}
-        for _, row in df.iterrows():
-            rail_name = str(row.iloc[0]).strip()  # First column is rail name
-            rows_dict[rail_name] = row
+        # Map rail names to their average values using whole columns instead of
+        # building a Series per row (first column is rail name)
+        rail_names = [str(name).strip() for name in df.iloc[:, 0].tolist()]
+        rows_dict = dict(zip(rail_names, df[self.average_column].tolist()))
         
         # Extract ALL metrics from the power summary file
         p_soc = 0
-        for rail_name, row in rows_dict.items():
+        for rail_name, average in rows_dict.items():
             try:
-                value = float(row[self.average_column])
+                value = float(average)
                 power_data[rail_name] = value
                 
                 # Track SOC power for energy calculation
@@ -134,11 +159,12 @@ class PowerParser(BaseParser):
             self.logger.debug(f"Calculated energy: {derived['Energy (J)']} J")
         
         # Calculate P_SOC+MEMORY if individual components are available
-        soc_components = ['P_VCC_PCORE', 'P_VCC_ECORE', 'P_VCCSA', 'P_VCCGT']
-        memory_components = ['P_VDDQ', 'P_VDD2H', 'P_VDD2L']
+        # (each rail is looked up once; missing or invalid rails count as -1 and are skipped)
+        soc_values = [power_data.get(comp, -1) for comp in _SOC_COMPONENTS]
+        memory_values = [power_data.get(comp, -1) for comp in _MEMORY_COMPONENTS]
         
-        soc_total = sum(power_data.get(comp, 0) for comp in soc_components if power_data.get(comp, -1) > 0)
-        memory_total = sum(power_data.get(comp, 0) for comp in memory_components if power_data.get(comp, -1) > 0)
+        soc_total = sum(value for value in soc_values if value > 0)
+        memory_total = sum(value for value in memory_values if value > 0)
         
         if soc_total > 0 and memory_total > 0:
             derived['P_SOC+MEMORY'] = soc_total + memory_total
@@ -167,43 +193,54 @@ class PowerTraceParser(BaseParser):
         super().__init__(config)
         self.sample_rate = self.config.get('sample_rate', 1000)  # Hz
         self.max_samples = self.config.get('max_samples', 100000)  # Limit for memory
+        self.stats_dtype = self.config.get('stats_dtype', 'float64')  # float32 halves memory traffic
     
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle trace files."""
-        filename_lower = file_path.name.lower()
-        trace_patterns = [
-            r'.*pacs-traces.*',
-            r'.*trace.*\.csv',
-            r'.*_sr\.csv',  # Sample rate files
-        ]
-        
-        return any(re.match(pattern, filename_lower) for pattern in trace_patterns)
+        return _is_trace_filename(file_path.name)
     
     def parse(self, file_path: Path) -> Dict[str, Any]:
         """Parse power trace file."""
         try:
             self.logger.info(f"Parsing power trace file: {file_path}")
             
-            # Read trace data
-            df = pd.read_csv(file_path, encoding='utf-8-sig', low_memory=False)
+            # Resolved here rather than in __init__ so a bad value only fails trace parsing
+            try:
+                stats_dtype = np.dtype(self.stats_dtype)
+            except TypeError:
+                raise ParsingError(f"Unknown stats_dtype '{self.stats_dtype}' (expected a NumPy dtype such as 'float32' or 'float64')")
+            
+            # Read trace data, stopping one row past the sample limit so long traces
+            # are never fully loaded into memory
+            df = pd.read_csv(file_path, encoding='utf-8-sig', low_memory=False,
+                             nrows=self.max_samples + 1)
             
             if df.empty:
                 raise ParsingError(f"Empty trace file: {file_path}")
             
             # Limit samples for memory efficiency
             if len(df) > self.max_samples:
-                self.logger.warning(f"Trace file has {len(df)} samples, limiting to {self.max_samples}")
+                self.logger.warning(f"Trace file has more than {self.max_samples} samples, limiting to {self.max_samples}")
                 df = df.head(self.max_samples)
             
-            # Calculate basic statistics for each column
+            # Calculate basic statistics for each numeric column in one 2-D pass
+            numeric_cols = list(df.select_dtypes(include=['float64', 'int64']).columns)
             trace_stats = {}
-            for col in df.columns:
-                if df[col].dtype in ['float64', 'int64']:
+            if numeric_cols:
+                values = df[numeric_cols].to_numpy(dtype=stats_dtype)
+                with warnings.catch_warnings():
+                    # All-NaN and single-sample columns yield NaN, as pandas does
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    means = np.nanmean(values, axis=0)
+                    mins = np.nanmin(values, axis=0)
+                    maxs = np.nanmax(values, axis=0)
+                    stds = np.nanstd(values, axis=0, ddof=1)
+                for idx, col in enumerate(numeric_cols):
                     trace_stats[col] = {
-                        'mean': float(df[col].mean()),
-                        'min': float(df[col].min()),
-                        'max': float(df[col].max()),
-                        'std': float(df[col].std())
+                        'mean': float(means[idx]),
+                        'min': float(mins[idx]),
+                        'max': float(maxs[idx]),
+                        'std': float(stds[idx])
                     }
             
             result = {
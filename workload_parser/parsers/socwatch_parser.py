@@ -2,24 +2,220 @@
 SocWatch data parser implementation.
 """
 
+import json
+import os
 import re
+import sys
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List
-import pandas as pd
+from typing import Callable, Dict, Any, List, Optional, FrozenSet, Tuple
 
 from ..core.parser import BaseParser
 from ..core.exceptions import ParsingError
 
 
+# SocWatch session traces are named <workload_prefix><session>.etl
+_ETL_SUFFIX_RE = re.compile(r'^(.*)(_extraSession|_hwSession|_infoSession|_osSession)\.etl$')
+
+# Commas outside double quotes: an even number of quotes follows them on the line
+_UNQUOTED_COMMA_RE = re.compile(r',(?=(?:[^"]*"[^"]*")*[^"]*$)')
+
+# Table separator rows: start with '---' or consist only of dashes and spaces
+_SEPARATOR_LINE_RE = re.compile(r'---|[- ]*$')
+
+# Key terms that identify parsed CPU model tables, matched case-insensitively
+_CPU_MODEL_KEY_RE = re.compile(r'processor|cpu|family|model|stepping', re.IGNORECASE)
+
+# Generic header terms that mark unprocessed C-state/P-state and raw CSV tables
+_GENERIC_STATE_HEADER_RE = re.compile(r'Component|State|Frequency|Residency|Time')
+_RAW_HEADER_TERM_RE = re.compile(r'Component|State|Frequency|Residency|Percentage')
+
+
+@lru_cache(maxsize=128)
+def _scan_etl_dir(parent_folder: str, mtime_ns: int) -> Tuple[Optional[str], FrozenSet[str], bool]:
+    """
+    Scan a folder once for SocWatch session ETL files.
+    
+    The folder mtime is part of the cache key so the inventory is refreshed
+    when files are added or removed. Returns (workload_prefix, sessions_found,
+    has_os_session) for one workload. When the folder holds sessions of
+    several workloads, the prefix with the most sessions wins, ties going to
+    the alphabetically first prefix, so the result never depends on the
+    order the folder is listed in.
+    """
+    sessions_by_prefix: Dict[str, set] = {}
+    
+    # os.scandir yields bare names without building Path objects or stat-ing entries
+    with os.scandir(parent_folder) as entries:
+        for entry in entries:
+            etl_name = entry.name
+            if not etl_name.endswith('.etl'):
+                continue
+            match = _ETL_SUFFIX_RE.match(etl_name)
+            if match:
+                # Workload prefix is everything before the _xxxSession.etl
+                prefix, session = match.groups()
+                sessions_by_prefix.setdefault(prefix, set()).add(session)
+    
+    if not sessions_by_prefix:
+        return None, frozenset(), False
+    
+    workload_prefix = min(sessions_by_prefix, key=lambda prefix: (-len(sessions_by_prefix[prefix]), prefix))
+    etl_sessions_found = sessions_by_prefix[workload_prefix]
+    return workload_prefix, frozenset(etl_sessions_found), '_osSession' in etl_sessions_found
+
+
+@lru_cache(maxsize=32)
+def _compile_lookup_pattern(lookups: Tuple[str, ...]) -> 're.Pattern[str]':
+    """Compile table lookup texts into a single alternation, longest first."""
+    ordered = sorted(set(lookups), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(lookup) for lookup in ordered))
+
+
+@lru_cache(maxsize=8)
+def _load_targets_file(path: str, mtime_ns: int, section: Optional[str] = None) -> Tuple[Dict[str, Any], ...]:
+    """
+    Load a target list from a JSON config file, memoized across parse calls.
+    
+    The mtime is part of the key so edits to the config are picked up. When
+    section is given the targets are read from that top-level key. Callers
+    must treat the returned target dicts as read-only.
+    """
+    with open(path, 'r') as f:
+        config = json.load(f)
+    targets = config.get(section, []) if section is not None else config
+    return tuple(targets)
+
+
+def _find_lookup_offsets(content: str, lookups: List[str]) -> Dict[str, int]:
+    """
+    Find the first line containing each lookup text in a single pass.
+    
+    The combined pattern is run once over the whole file with finditer, so
+    lines without any lookup are never visited from Python. Each line it hits
+    is checked against every pending lookup, so overlapping lookups resolve to
+    the same line a per-target linear search would find. Lines are reported
+    by the offset of their first character in content. The scan stops as
+    soon as every lookup has been located.
+    """
+    if not lookups:
+        return {}
+    
+    pattern = _compile_lookup_pattern(tuple(lookups))
+    pending = set(lookups)
+    lookup_offsets = {}
+    
+    last_line_start = -1
+    for match in pattern.finditer(content):
+        start = match.start()
+        line_start = content.rfind('\n', 0, start) + 1
+        if line_start == last_line_start:
+            continue
+        last_line_start = line_start
+        
+        line_end = content.find('\n', start)
+        line = content[line_start:line_end if line_end != -1 else len(content)]
+        for lookup in [lookup for lookup in pending if lookup in line]:
+            lookup_offsets[lookup] = line_start
+            pending.discard(lookup)
+        
+        # Every target located; the rest of the file cannot change the result
+        if not pending:
+            break
+    
+    return lookup_offsets
+
+
+def _split_table_line(line: str) -> List[str]:
+    """
+    Split one table row into raw cells, quotes included.
+    
+    Rows with balanced quotes are split only on commas outside the quotes, so
+    quoted commas stay in their cell; each row is split on its own, so a stray
+    quote can never pull the following rows into one cell. Rows without
+    quotes, or with an unmatched one, are split on every comma.
+    """
+    if '"' in line and line.count('"') % 2 == 0:
+        return _UNQUOTED_COMMA_RE.split(line)
+    return line.split(',')
+
+
+def _read_table_block(content: str, lookup_offset: int) -> List[List[str]]:
+    """
+    Tokenize the table that follows the lookup line starting at lookup_offset.
+    
+    The table runs until the next empty line. Lines are sliced out of the
+    content as they are reached, so the file is never split into a list of
+    all its lines. Separator lines are skipped and every other row is split
+    into cells by _split_table_line.
+    """
+    # Collect table lines until empty line or end of file
+    body = []
+    line_end = content.find('\n', lookup_offset)
+    while line_end != -1:
+        line_start = line_end + 1
+        line_end = content.find('\n', line_start)
+        line = content[line_start:line_end if line_end != -1 else len(content)].strip()
+        
+        # Empty line marks end of table
+        if not line:
+            break
+        
+        # Skip separator lines (only dashes); every one starts with '-' once
+        # stripped, so data rows never reach the regex
+        if line[0] == '-' and _SEPARATOR_LINE_RE.match(line):
+            continue
+        
+        body.append(line)
+    
+    raw_table_lines = []
+    for row in map(_split_table_line, body):
+        # Clean up each part and drop cells empty in the raw row ("" is kept as ''),
+        # stripping whitespace once per cell
+        cells = (part.strip() for part in row)
+        parts = [cell.strip('"') for cell in cells if cell]
+        if parts:  # Only add non-empty rows
+            # Row labels (C-states, cores, frequencies) repeat across tables and files
+            parts[0] = sys.intern(parts[0])
+            raw_table_lines.append(parts)
+    
+    return raw_table_lines
+
+
+# Flattened SocWatch metrics from earlier parses, oldest first; see _remember_socwatch_metrics
+_SOCWATCH_METRICS_CACHE: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+_SOCWATCH_METRICS_CACHE_SIZE = 64
+
+
+def _cache_key(value: Any) -> str:
+    """Render a config or target list as canonical JSON text for use in a cache key."""
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _remember_socwatch_metrics(key: Tuple[Any, ...], metrics: Dict[str, Any]) -> None:
+    """
+    Store the metrics of a parse, dropping the oldest entry once the cache is full.
+    
+    Parser instances are created per file, so results are kept at module level.
+    The key holds the parser class, its config and targets (as JSON text) next
+    to the file path, mtime and size, so subclasses, target config edits and
+    edited files all get a fresh parse.
+    """
+    if len(_SOCWATCH_METRICS_CACHE) >= _SOCWATCH_METRICS_CACHE_SIZE:
+        _SOCWATCH_METRICS_CACHE.pop(next(iter(_SOCWATCH_METRICS_CACHE)), None)
+    _SOCWATCH_METRICS_CACHE[key] = metrics
+
+
 def cpu_model_table(table_data: List[List[str]]) -> Dict[str, Any]:
     """Parse CPU model table."""
     data = {}
     for line in table_data:
         if len(line) > 0 and '=' in line[0]:
-            items = line[0].split("=")
-            if len(items) > 1:
-                key = items[0].split("/")[1].strip() if "/" in items[0] else items[0].strip()
-                data[key] = items[-1].strip()
+            # Name is before the first '=', value after the last one
+            name = line[0].partition("=")[0]
+            key = name.split("/", 2)[1].strip() if "/" in name else name.strip()
+            data[key] = line[0].rpartition("=")[2].strip()
     return data
 
 
@@ -28,18 +224,16 @@ def one_line_colon_separator(table_data: List[List[str]]) -> Dict[str, Any]:
     data = {}
     for line in table_data:
         if len(line) > 0 and ':' in line[0]:
-            items = line[0].split(":")
-            if len(items) >= 2:
-                key = items[0].strip()
-                value = items[-1].strip()
-                # Try to convert to number if possible
-                try:
-                    if '.' in value:
-                        data[key] = float(value)
-                    else:
-                        data[key] = int(value)
-                except ValueError:
-                    data[key] = value
+            key = line[0].partition(":")[0].strip()
+            value = line[0].rpartition(":")[2].strip()
+            # Try to convert to number if possible
+            try:
+                if '.' in value:
+                    data[key] = float(value)
+                else:
+                    data[key] = int(value)
+            except ValueError:
+                data[key] = value
     return data
 
 
@@ -51,7 +245,7 @@ def temp_avr_table(table_data: List[List[str]], label: str) -> Dict[str, Any]:
             if index == 0:
                 data[label] = line[4]
             else:
-                key = line[0].split("/")[-1] if "/" in line[0] else line[0]
+                key = line[0].rpartition("/")[2]
                 try:
                     data[key] = round(float(line[4]), 2)
                 except (ValueError, IndexError):
@@ -87,7 +281,7 @@ def core_residency_table(table_data: List[List[str]]) -> Dict[str, Any]:
         for index in range(1, len(header_row)):
             if index >= len(data_row):
                 break
-            key = header_row[index].split("/")[-1] if "/" in header_row[index] else header_row[index]
+            key = header_row[index].rpartition("/")[2]
             if "(%)" not in key:
                 break
             try:
@@ -104,13 +298,12 @@ def os_wakeups_table(table_data: List[List[str]]) -> Dict[str, Any]:
         if len(line) >= 3:
             if idx == 0:
                 key = "OS_wakeups"
-                value = f"{line[1].split(' ')[0]} ({' '.join(line[2].split(' ')[:-1])})"
+                # First word of the process header and the CPU header without its trailing unit
+                value = f"{line[1].partition(' ')[0]} ({line[2].rpartition(' ')[0]})"
             elif idx == 1:
                 key = "Rank"
-                # Extract percentage from the data and add "Overall" prefix
-                process_name = line[1].split(' ')[0]
-                # Look for percentage in parentheses in the third column
-                percentage_match = line[2].split('(')[-1].split(')')[0] if '(' in line[2] and ')' in line[2] else line[2]
+                # Add "Overall" prefix to the process name
+                process_name = line[1].partition(' ')[0]
                 value = f"Overall ({process_name})"
             else:
                 # For Thread Wakeups (OS): Join Rank.ProcessName with CPU%(Platform) in parentheses
@@ -120,9 +313,9 @@ def os_wakeups_table(table_data: List[List[str]]) -> Dict[str, Any]:
                 process_name_with_pid = line[1] if len(line) > 1 else ""
                 # Remove PID part - typically in format "ProcessName (PID)"
                 if '(' in process_name_with_pid and ')' in process_name_with_pid:
-                    process_name = process_name_with_pid.split('(')[0].strip()
+                    process_name = process_name_with_pid.partition('(')[0].strip()
                 else:
-                    process_name = process_name_with_pid.split(' ')[0] if process_name_with_pid else ""
+                    process_name = process_name_with_pid.partition(' ')[0]
                 
                 # Extract CPU % (Platform) from 3rd column
                 cpu_platform = line[2] if len(line) > 2 else ""
@@ -144,7 +337,9 @@ def core_freq_avr_table(table_data: List[List[str]], key_idx: int = 0, value_idx
         for index in range(1, len(table_data)):
             line = table_data[index]
             if len(line) > max(key_idx, value_idx):
-                key = line[key_idx].split("/")[2] if "/" in line[key_idx] and len(line[key_idx].split("/")) > 2 else line[key_idx]
+                # Third path segment (e.g. "Core_0"), or the whole label if it is shorter
+                segments = line[key_idx].split("/", 3)
+                key = segments[2] if len(segments) > 2 else line[key_idx]
                 value = line[value_idx]
                 try:
                     data[key] = int(float(value))
@@ -182,7 +377,7 @@ def cpu_pstate_table(table_data: List[List[str]], core_type: Dict[str, str] = No
     short_header = []
     if core_type:
         for core_full_name in header_residency_full:
-            core_idx = core_full_name.split("/")[2]  # Extract core index like "Core_0"
+            core_idx = core_full_name.split("/", 3)[2]  # Extract core index like "Core_0"
             if core_idx in core_type:
                 short_header.append(core_idx + " " + core_type[core_idx])
             else:
@@ -190,7 +385,7 @@ def cpu_pstate_table(table_data: List[List[str]], core_type: Dict[str, str] = No
     else:
         # Fallback if no core_type available
         for core_full_name in header_residency_full:
-            core_idx = core_full_name.split("/")[2]
+            core_idx = core_full_name.split("/", 3)[2]
             short_header.append(core_idx)
     
     # Group cores by type for duplication (enhanced for heterogeneous SoCs)
@@ -199,7 +394,7 @@ def cpu_pstate_table(table_data: List[List[str]], core_type: Dict[str, str] = No
     
     if core_type:
         for col_idx, core_full_name in enumerate(header_residency_full):
-            core_idx = core_full_name.split("/")[2]  # Extract core index like "Core_0"
+            core_idx = core_full_name.split("/", 3)[2]  # Extract core index like "Core_0"
             
             if core_idx in core_type:
                 core_type_name = core_type[core_idx]
@@ -281,7 +476,7 @@ def default_residency_table(table_data: List[List[str]], key_idx: int = 0, value
             key = line[key_idx]
             # Handle P-state tables by removing decimal part
             if "_Pstate" in key and idx > 0 and "." in key:
-                key = key.split(".")[0]
+                key = key.partition(".")[0]
             
             value = line[value_idx]
             try:
@@ -291,6 +486,30 @@ def default_residency_table(table_data: List[List[str]], key_idx: int = 0, value
     return data
 
 
+@lru_cache(maxsize=64)
+def _parse_bucket_bounds(buckets: Tuple[str, ...]) -> Tuple[Tuple[float, float, bool, str], ...]:
+    """
+    Parse bucket labels into (min, max, is_range, bucket) tuples, in bucket order.
+    
+    Single frequency buckets have min == max and malformed buckets are left
+    out so they never match. Bucket lists come from the target config, so
+    each distinct list is parsed once.
+    """
+    bucket_bounds = []
+    for bucket in buckets:
+        try:
+            if "-" in bucket:
+                ranges = bucket.split("-")
+                if len(ranges) == 2:
+                    bucket_bounds.append((float(ranges[0]), float(ranges[1]), True, bucket))
+            else:
+                bucket_freq = float(bucket)
+                bucket_bounds.append((bucket_freq, bucket_freq, False, bucket))
+        except (ValueError, TypeError):
+            continue
+    return tuple(bucket_bounds)
+
+
 def bucketized_table(table_data: List[List[str]], key_idx: int = 0, value_idx: int = 1, buckets: List[str] = None, table_label: str = None) -> Dict[str, Any]:
     """Parse bucketized table with frequency ranges for NOC, NPU, and iGFX tables."""
     
@@ -306,7 +525,8 @@ def bucketized_table(table_data: List[List[str]], key_idx: int = 0, value_idx: i
         return data
     
     # Initialize bucketized data structure
-    bucketized_data = {bucket: 0.0 for bucket in buckets}
+    bucketized_data = dict.fromkeys(buckets, 0.0)
+    bucket_bounds = _parse_bucket_bounds(tuple(buckets))
     
     # Process each line of table data (skip header row)
     for idx, line in enumerate(table_data):
@@ -325,32 +545,16 @@ def bucketized_table(table_data: List[List[str]], key_idx: int = 0, value_idx: i
                 # Skip non-numeric data
                 continue
             
-            # Check each bucket for frequency matches
-            matched = False
-            for bucket in buckets:
-                if "-" in bucket:
-                    # Range bucket: accumulate values for frequencies in range
-                    try:
-                        ranges = bucket.split("-")
-                        if len(ranges) == 2:
-                            min_freq = float(ranges[0])
-                            max_freq = float(ranges[1])
-                            if min_freq <= freq <= max_freq:
-                                bucketized_data[bucket] += numeric_value
-                                matched = True
-                                break  # Found the bucket, no need to check others
-                    except (ValueError, TypeError):
-                        continue
-                else:
-                    # Single frequency bucket: direct copy if exact match
-                    try:
-                        bucket_freq = float(bucket)
-                        if freq == bucket_freq:
-                            bucketized_data[bucket] = numeric_value
-                            matched = True
-                            break  # Found exact match, no need to check others
-                    except (ValueError, TypeError):
-                        continue
+            # First bucket that contains the frequency wins
+            for min_freq, max_freq, is_range, bucket in bucket_bounds:
+                if min_freq <= freq <= max_freq:
+                    if is_range:
+                        # Range bucket: accumulate values for frequencies in range
+                        bucketized_data[bucket] += numeric_value
+                    else:
+                        # Single frequency bucket: direct copy if exact match
+                        bucketized_data[bucket] = numeric_value
+                    break
     
     # Return only bucketized results with table-specific header
     result_data = {}
@@ -377,41 +581,176 @@ def bucketized_table(table_data: List[List[str]], key_idx: int = 0, value_idx: i
     return result_data
 
 
-def socwatch_table_type_checker(table_data: List[List[str]], label: str, core_type: Dict[str, str] = None, 
-                                soc_target: Dict[str, Any] = None, tdic: Dict[str, Any] = None) -> Dict[str, Any]:
-    """Classify and parse SocWatch tables based on their labels using specialized parsing functions."""
+_BW_TABLES = frozenset({'DDR_BW', 'IO_BW', 'VC1_BW', 'NPU_BW', 'Media_BW', 'IPU_BW', 'CCE_BW', 'GT_BW', 'D2D_BW'})
+
+_TableParser = Callable[[List[List[str]], Optional[Dict[str, str]]], Dict[str, Any]]
+
+
+@lru_cache(maxsize=128)
+def _table_parser_for(label: str, buckets: Optional[Tuple[str, ...]] = None) -> _TableParser:
+    """Resolve the specialized parse function for a table label and bucket config.
+    
+    The returned callable takes (table_data, core_type); label classification and
+    column selection are decided here once instead of on every table parse.
+    """
     if label == 'CPU_model':
-        return cpu_model_table(table_data)
-    elif label in ['Core_Cstate', 'ACPI_Cstate']:
-        return core_residency_table(table_data)
+        return lambda table_data, core_type: cpu_model_table(table_data)
+    elif label in ('Core_Cstate', 'ACPI_Cstate'):
+        return lambda table_data, core_type: core_residency_table(table_data)
     elif label == 'OS_wakeups':
-        return os_wakeups_table(table_data)
+        return lambda table_data, core_type: os_wakeups_table(table_data)
     elif label == 'CPU_Pavr':
-        return core_freq_avr_table(table_data, 0, 1)
+        return lambda table_data, core_type: core_freq_avr_table(table_data, 0, 1)
     elif label == 'CPU_Pstate':
         # Use specialized CPU P-state parsing with core type grouping
-        return cpu_pstate_table(table_data, core_type)
+        return cpu_pstate_table
     elif label == 'DC_count':
-        return one_line_colon_separator(table_data)
-    elif label in ['DDR_BW', 'IO_BW', 'VC1_BW', 'NPU_BW', 'Media_BW', 'IPU_BW', 'CCE_BW', 'GT_BW', 'D2D_BW']:
-        return bw_total_avr(table_data, label)
-    elif label in ['CPU_temp', 'SoC_temp']:
-        return temp_avr_table(table_data, label)
+        return lambda table_data, core_type: one_line_colon_separator(table_data)
+    elif label in _BW_TABLES:
+        return lambda table_data, core_type: bw_total_avr(table_data, label)
+    elif label in ('CPU_temp', 'SoC_temp'):
+        return lambda table_data, core_type: temp_avr_table(table_data, label)
     elif label == 'PMC+SLP_S0':
-        return default_residency_table(table_data, 0, 2)
-    elif label in ['NPU_Pstate', 'NoC_Pstate', 'iGFX_Pstate']:
-        # Check if config has buckets defined for this table
-        if soc_target and 'buckets' in soc_target:
-            # Config HAS buckets defined, so DO bucketize using config buckets
-            return bucketized_table(table_data, 0, 1, soc_target['buckets'], label)
-        else:
-            # Config does NOT have buckets, so DON'T bucketize - just return all frequencies
-            return default_residency_table(table_data, 0, 1)
-    elif soc_target and 'buckets' in soc_target:
-        # For other tables that have buckets in config
-        return bucketized_table(table_data, 0, 1, soc_target['buckets'], label)
+        return lambda table_data, core_type: default_residency_table(table_data, 0, 2)
+    elif buckets is not None:
+        # Config HAS buckets defined (NPU/NoC/iGFX P-states or any other table), so DO bucketize
+        return lambda table_data, core_type: bucketized_table(table_data, 0, 1, buckets, label)
     else:
-        return default_residency_table(table_data, 0, 1)
+        # Config does NOT have buckets, so DON'T bucketize - just return all frequencies
+        return lambda table_data, core_type: default_residency_table(table_data, 0, 1)
+
+
+def socwatch_table_type_checker(table_data: List[List[str]], label: str, core_type: Dict[str, str] = None, 
+                                soc_target: Dict[str, Any] = None, tdic: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Classify and parse SocWatch tables based on their labels using specialized parsing functions."""
+    buckets = tuple(soc_target['buckets']) if soc_target and 'buckets' in soc_target else None
+    return _table_parser_for(label, buckets)(table_data, core_type)
+
+
+# Table header descriptions and values keyed by table, based on sample Excel
+_HEADER_TEXT_MAP = {
+    'CPU_model': 'CPU_model',
+    'PCH_SLP50': 'PCH SLP-S0 States',
+    'S0ix_Substate': 'State',
+    'PKG_Cstate': 'C-State',
+    'Core_Cstate': 'C-State',
+    'Core_Concurrency': '# Active Cores',
+    'ACPI_Cstate': 'C-State',
+    'OS_wakeups': 'OS_wakeups',
+    'CPU-iGPU': 'CPU/Package_0 Residency (%)',
+    'CPU_Pavr': 'CPU ID',
+    'CPU_Pstate': 'P-State',
+    'RC_Cstate': 'C-State',
+    'DDR_BW': 'DDR_BW_AvrRt(MB/s)',
+    'IO_BW': 'IO_BW_AvrRt(MB/s)',
+    'VC1_BW': 'VC1_BW_AvrRt(MB/s)',
+    'NPU_BW': 'NPU_BW_AvrRt(MB/s)',
+    'Media_BW': 'Media_BW_AvrRt(MB/s)',
+    'IPU_BW': 'IPU_BW_AvrRt(MB/s)',
+    'CCE_BW': 'CCE_BW_AvrRt(MB/s)',
+    'GT_BW': 'GT_BW_AvrRt(MB/s)',
+    'D2D_BW': 'D2D_BW_AvrRt(MB/s)',
+    'CPU_temp': 'Component Name',
+    'SoC_temp': 'Component Name',
+    'NPU_Dstate': 'State',
+    'PMC+SLP_S0': 'PCH IP Blocks',
+    'Media_Cstate': 'C-State',
+    'NPU_Pstate': 'Frequency (MHz)',
+    'MEMSS_Pstate': 'Frequency (MHz)',
+    'NoC_Pstate': 'Frequency (MHz)',
+    'iGFX_Pstate': 'Frequency (MHz)'
+}
+
+_HEADER_VALUE_MAP = {
+    'CPU_model': 'CPU_model',
+    'PCH_SLP50': 'PCH Residency (%)',
+    'S0ix_Substate': 'Residency (%)',
+    'PKG_Cstate': 'Package Residency ()',
+    'Core_Cstate': 'CPU/Package_0/Core_0 Residency ()',
+    'Core_Concurrency': 'Time Active (%)',
+    'ACPI_Cstate': 'CPU/Package_0/Core_0 Residency ()',
+    'OS_wakeups': 'Process Name (PID) (CPU % (Platform))',
+    'CPU-iGPU': 'CPU/Package_0 Residency (%)',
+    'CPU_Pavr': 'Average (MHz)',
+    'CPU_Pstate': 'Frequency (MHz)',
+    'RC_Cstate': 'iGPU/Graphics Residency ()',
+    'CPU_temp': 'Time-weighted Avg (oC)',
+    'SoC_temp': 'Time-weighted Avg (oC)',
+    'NPU_Dstate': 'Residency (%)',
+    'PMC+SLP_S0': 'Description',
+    'Media_Cstate': 'Residency ()',
+    'NPU_Pstate': 'NPU (%)',
+    'MEMSS_Pstate': 'MEMSS (%)',
+    'NoC_Pstate': 'NoC (%)',
+    'iGFX_Pstate': 'iGFX (%)'
+}
+
+_BW_SUFFIX = '_BW'
+
+# Separator between metric name and table key in flattened Excel metric names
+_METRIC_KEY_SEP = '        '
+
+
+# Checks for whether a parsed table came out of a specialized table function.
+# Each takes (table_data, table_key, first_key) with table_data non-empty.
+
+def _is_specialized_bw(table_data: Dict[str, Any], table_key: str, first_key: str) -> bool:
+    """Bandwidth tables collapse to a single AvrRt entry."""
+    return len(table_data) == 1 and 'AvrRt(MB/s)' in first_key
+
+
+def _is_specialized_temp(table_data: Dict[str, Any], table_key: str, first_key: str) -> bool:
+    """Temperature tables are keyed by component names prefixed with the table key."""
+    return len(table_data) > 1 and table_key in first_key
+
+
+def _is_specialized_cpu_model(table_data: Dict[str, Any], table_key: str, first_key: str) -> bool:
+    """CPU model tables carry processor/family/model/stepping style keys."""
+    return any(_CPU_MODEL_KEY_RE.search(str(key)) for key in table_data)
+
+
+def _is_specialized_os_wakeups(table_data: Dict[str, Any], table_key: str, first_key: str) -> bool:
+    """OS wakeups collapse to a single OS_wakeups entry."""
+    return 'OS_wakeups' in table_data
+
+
+def _is_specialized_dc_count(table_data: Dict[str, Any], table_key: str, first_key: str) -> bool:
+    """DC count is a colon separated single line without unit headers."""
+    return not any('(' in str(key) and ')' in str(key) for key in islice(table_data, 2))
+
+
+def _is_specialized_bucketized(table_data: Dict[str, Any], table_key: str, first_key: str) -> bool:
+    """Bucketized P-state tables include the "Frequency Bucket (MHz)" header."""
+    return any('Frequency Bucket (MHz)' in str(key) for key in table_data)
+
+
+def _is_specialized_state(table_data: Dict[str, Any], table_key: str, first_key: str) -> bool:
+    """C-state and P-state tables are specialized unless led by a generic unit header."""
+    return not ('(' in first_key and ')' in first_key
+                and _GENERIC_STATE_HEADER_RE.search(first_key) is not None)
+
+
+def _is_specialized_other(table_data: Dict[str, Any], table_key: str, first_key: str) -> bool:
+    """Other tables are specialized unless the first key looks like a raw CSV header."""
+    return not ('(' in first_key and ')' in first_key
+                and _RAW_HEADER_TERM_RE.search(first_key) is not None)
+
+
+_SPECIALIZED_CHECKS: Dict[str, Callable[[Dict[str, Any], str, str], bool]] = {
+    'CPU_temp': _is_specialized_temp,
+    'SoC_temp': _is_specialized_temp,
+    'CPU_model': _is_specialized_cpu_model,
+    'OS_wakeups': _is_specialized_os_wakeups,
+    'DC_count': _is_specialized_dc_count,
+    'NPU_Pstate': _is_specialized_bucketized,
+    'NoC_Pstate': _is_specialized_bucketized,
+    'iGFX_Pstate': _is_specialized_bucketized,
+    'Core_Cstate': _is_specialized_state,
+    'ACPI_Cstate': _is_specialized_state,
+    'PKG_Cstate': _is_specialized_state,
+    'CPU_Pstate': _is_specialized_state,
+    'CPU_Pavr': _is_specialized_state,
+}
 
 
 class SocwatchParser(BaseParser):
@@ -429,59 +768,60 @@ class SocwatchParser(BaseParser):
         if file_path.suffix.lower() != '.csv':
             return False
         
-        # Get the parent folder
-        parent_folder = file_path.parent
         filename = file_path.name
         
         # Skip WakeupAnalysis files for now (as per user request)
         if 'wakeupanalysis' in filename.lower():
             return False
         
-        # Check for Socwatch ETL files in the same folder
-        required_etl_files = [
-            '_extraSession.etl',
-            '_hwSession.etl', 
-            '_infoSession.etl',
-            '_osSession.etl'  # SocWatch parser requires _osSession.etl
-        ]
-        
-        # Check if all required ETL files exist
-        etl_files_found = []
-        workload_prefix = None
+        # Parent folder as a plain string, used for both the stat and the cache key;
+        # a folder that does not exist cannot hold the session ETL files
+        parent_folder = os.fspath(file_path.parent)
+        try:
+            folder_mtime_ns = os.stat(parent_folder).st_mtime_ns
+        except OSError:
+            return False
         
-        for etl_file in parent_folder.glob('*.etl'):
-            etl_name = etl_file.name
-            for required_suffix in required_etl_files:
-                if etl_name.endswith(required_suffix):
-                    etl_files_found.append(required_suffix)
-                    # Extract workload prefix (everything before the _xxxSession.etl)
-                    workload_prefix = etl_name.replace(required_suffix, '')
-                    break
+        # Check for Socwatch ETL files in the same folder
+        # (_extraSession, _hwSession, _infoSession and _osSession are all required)
+        workload_prefix, etl_sessions_found, _ = _scan_etl_dir(
+            parent_folder, folder_mtime_ns
+        )
         
         # Must have all 4 required ETL files (including _osSession.etl)
-        if len(set(etl_files_found)) < 4:
+        if len(etl_sessions_found) < 4:
             return False
         
-        # Check if this CSV file matches the workload prefix
-        if workload_prefix and filename.startswith(workload_prefix) and filename.endswith('.csv'):
-            return True
-        
-        return False
+        # Check if this CSV file matches the workload prefix (the .csv suffix was checked above)
+        return bool(workload_prefix) and filename.startswith(workload_prefix)
     
     def parse(self, file_path: Path) -> Dict[str, Any]:
         """Parse SocWatch data file to extract all summary tables in config order."""
         try:
             self.logger.info(f"Parsing Socwatch file: {file_path}")
             
-            # Read the file as text to extract specific sections
-            with open(file_path, 'r', encoding=self.encoding) as f:
-                content = f.read()
-            
-            # Extract all tables as a list of dictionaries in config order
-            socwatch_tables = self._parse_socwatch_content(content)
+            # Targets are resolved per call so config edits and the working
+            # directory are reflected in the cache key
+            socwatch_targets = self._load_socwatch_targets()
             
-            # Flatten the tables for Excel reporting while maintaining grouping and order
-            target_metrics = self._extract_target_metrics(socwatch_tables)
+            # Repeat parses of an unchanged file are served from the module cache;
+            # copy so callers can't modify the cached metrics
+            stat = Path(file_path).stat()
+            cache_key = (type(self), _cache_key(self.config), _cache_key(socwatch_targets),
+                         str(file_path), stat.st_mtime_ns, stat.st_size)
+            cached_metrics = _SOCWATCH_METRICS_CACHE.get(cache_key)
+            if cached_metrics is None:
+                # Read the whole file; sections are located in the content and read line by line
+                with open(file_path, 'r', encoding=self.encoding) as f:
+                    content = f.read()
+                
+                # Extract all tables as a list of dictionaries in config order
+                socwatch_tables = self._parse_socwatch_content(content, socwatch_targets)
+                
+                # Flatten the tables for Excel reporting while maintaining grouping and order
+                cached_metrics = self._extract_target_metrics(socwatch_tables)
+                _remember_socwatch_metrics(cache_key, cached_metrics)
+            target_metrics = dict(cached_metrics)
             
             # Check if any metrics were extracted
             if not target_metrics:
@@ -502,32 +842,32 @@ class SocwatchParser(BaseParser):
         except Exception as e:
             raise ParsingError(f"Failed to parse SocWatch data from {file_path}: {str(e)}")
     
-    def _parse_socwatch_content(self, content: str) -> List[Dict[str, Any]]:
+    def _parse_socwatch_content(self, content: str,
+                                socwatch_targets: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """Parse Socwatch content to extract all summary tables as a list of dictionaries in config order."""
         socwatch_tables = []
-        lines = content.split('\n')
         
-        # Load socwatch targets from config in their defined order
-        socwatch_targets = self._load_socwatch_targets()
+        # Load socwatch targets from config in their defined order unless the caller resolved them
+        if socwatch_targets is None:
+            socwatch_targets = self._load_socwatch_targets()
+        
+        # Locate every lookup text in one pass over the file
+        lookup_offsets = _find_lookup_offsets(content, [target['lookup'] for target in socwatch_targets])
         
         # Process each target in the order defined in config
         for target in socwatch_targets:
             lookup_text = target['lookup']
-            target_key = target['key']
+            target_key = sys.intern(target['key'])
             
             # Find the lookup text in the file
-            table_start_idx = -1
-            for i, line in enumerate(lines):
-                if lookup_text in line:
-                    table_start_idx = i
-                    break
+            table_start = lookup_offsets.get(lookup_text, -1)
             
-            if table_start_idx == -1:
+            if table_start == -1:
                 self.logger.debug(f"Table lookup '{lookup_text}' not found for {target_key}")
                 continue
             
             # Extract table data starting after the lookup line
-            table_data = self._extract_table_data(lines, table_start_idx, target)
+            table_data = self._extract_table_data(content, table_start, target)
             if table_data:
                 # Store as dictionary with metadata and data (headers integrated into data)
                 table_dict = {
@@ -547,14 +887,10 @@ class SocwatchParser(BaseParser):
     def _load_socwatch_targets(self) -> List[Dict[str, Any]]:
         """Load socwatch targets from enhanced config."""
         try:
-            from pathlib import Path
-            import json
-            
-            config_path = Path('config/enhanced_parser_config.json')
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                return config.get('socwatch_targets', [])
+            config_path = os.path.abspath('config/enhanced_parser_config.json')
+            if os.path.exists(config_path):
+                mtime_ns = os.stat(config_path).st_mtime_ns
+                return list(_load_targets_file(config_path, mtime_ns, 'socwatch_targets'))
             else:
                 self.logger.warning("Enhanced config not found, using default targets")
                 return self._get_default_targets()
@@ -571,34 +907,12 @@ class SocwatchParser(BaseParser):
             {"key": "CPU_temp", "lookup": "Temperature Metrics Summary - Sampled: Min/Max/Avg", "description": "CPU temperature"},
         ]
     
-    def _extract_table_data(self, lines: List[str], lookup_idx: int, target: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_table_data(self, content: str, lookup_offset: int, target: Dict[str, Any]) -> Dict[str, Any]:
         """Extract table data after finding the lookup text using specialized table classification."""
         target_key = target['key']
         
-        # Start from the line after the lookup text
-        current_idx = lookup_idx + 1
-        
-        # Collect raw table lines until empty line or end of file
-        raw_table_lines = []
-        while current_idx < len(lines):
-            line = lines[current_idx].strip()
-            
-            # Empty line marks end of table
-            if not line:
-                break
-            
-            # Skip separator lines (only dashes)
-            if line.startswith('---') or line.replace('-', '').replace(' ', '') == '':
-                current_idx += 1
-                continue
-            
-            # Add line to raw table data
-            # Split by comma and clean up each part
-            parts = [part.strip().strip('"') for part in line.split(',') if part.strip()]
-            if parts:  # Only add non-empty rows
-                raw_table_lines.append(parts)
-            
-            current_idx += 1
+        # Collect raw table rows starting from the line after the lookup text
+        raw_table_lines = _read_table_block(content, lookup_offset)
         
         # If no table data found, return empty dict
         if not raw_table_lines:
@@ -635,60 +949,9 @@ class SocwatchParser(BaseParser):
                     fallback_data[row[0]] = row[1]
             return fallback_data
     
-
-    
-
-    
-
-    
-
-    
-
-    
-
-    
-    def _parse_default_table(self, table_lines: List[str], key: str) -> Dict[str, Any]:
-        """Parse default residency table."""
-        default_data = {}
-        
-        for line in table_lines:
-            parts = [part.strip() for part in line.split(',') if part.strip()]
-            if len(parts) >= 2:
-                state_name = parts[0]
-                value = parts[1]
-                default_data[state_name] = value
-        
-        return default_data
-    
-    def _apply_bucketing(self, data: Dict[str, Any], buckets: List[str]) -> Dict[str, Any]:
-        """Apply bucketing to P-state data."""
-        bucketed_data = {}
-        
-        for bucket in buckets:
-            bucketed_data[bucket] = 0.0
-        
-        for state, value in data.items():
-            if state.isdigit():
-                freq = int(state)
-                for bucket in buckets:
-                    if '-' in bucket:
-                        # Range bucket
-                        range_parts = bucket.split('-')
-                        if len(range_parts) == 2:
-                            min_freq = int(range_parts[0])
-                            max_freq = int(range_parts[1])
-                            if min_freq <= freq <= max_freq:
-                                bucketed_data[bucket] += float(value) if isinstance(value, str) and value.replace('.', '').isdigit() else 0
-                    elif bucket == state:
-                        # Exact match
-                        bucketed_data[bucket] = float(value) if isinstance(value, str) and value.replace('.', '').isdigit() else 0
-        
-        return bucketed_data
-    
     def _extract_target_metrics(self, socwatch_tables: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extract metrics from parsed Socwatch tables list for Excel reporting, maintaining config order and grouping."""
-        from collections import OrderedDict
-        target_metrics = OrderedDict()
+        target_metrics = {}
         
         # Process each table in the order they appear (which follows config order)
         for table_dict in socwatch_tables:
@@ -701,153 +964,47 @@ class SocwatchParser(BaseParser):
                 # Specialized tables already have proper key-value structure and don't need extra headers
                 is_specialized_table = self._is_specialized_table_format(table_data, table_key)
                 
+                # Every metric name in this table ends with the same separator + table key
+                key_suffix = _METRIC_KEY_SEP + table_key
+                
                 if not is_specialized_table:
                     # Add table header only for non-specialized tables
-                    header_text = self._get_table_header_text(table_key, target_info, table_data)
-                    header_key = f"{header_text}        {table_key}"
-                    target_metrics[header_key] = self._get_table_header_value(table_key, table_data)
+                    header_text, header_value = self._get_table_header_pair(table_key, target_info, table_data)
+                    target_metrics[header_text + key_suffix] = header_value
                 
                 # Add all data rows for this table before moving to the next table
                 # This ensures complete grouping of each table's data
-                for metric_key, metric_value in table_data.items():
-                    data_key = f"{metric_key}        {table_key}"
-                    target_metrics[data_key] = metric_value
+                target_metrics.update(
+                    (metric_key + key_suffix, metric_value) for metric_key, metric_value in table_data.items()
+                )
         
         return target_metrics
     
     def _is_specialized_table_format(self, table_data: Dict[str, Any], table_key: str) -> bool:
         """Check if table data has been processed by specialized parsing functions."""
-        # All tables processed by the new classification system should be considered specialized
-        # This prevents adding redundant headers for any table that went through socwatch_table_type_checker
-        
-        # Check if this looks like output from specialized parsing functions
-        keys = list(table_data.keys())
-        
         # If table is empty, not specialized
-        if not keys:
+        if not table_data:
             return False
         
-        # Check for bandwidth tables - they have a specific format with AvrRt in the key
-        if table_key.endswith('_BW'):
-            return len(keys) == 1 and 'AvrRt(MB/s)' in str(keys[0])
-        
-        # Check for temperature tables - they have component names as keys
-        if table_key in ['CPU_temp', 'SoC_temp']:
-            return len(keys) > 1 and table_key in str(keys[0])
-        
-        # Check for CPU model table - has specific key patterns
-        if table_key == 'CPU_model':
-            return any(key for key in keys if any(term in str(key).lower() for term in ['processor', 'cpu', 'family', 'model', 'stepping']))
-        
-        # Check for OS wakeups table - has specific format
-        if table_key == 'OS_wakeups':
-            return 'OS_wakeups' in keys
-        
-        # Check for DC count table - colon separated single line
-        if table_key == 'DC_count':
-            return len(keys) >= 1 and not any('(' in str(key) and ')' in str(key) for key in keys[:2])
-        
-        # Check for bucketized P-state tables - they have "Frequency Bucket (MHz)" header
-        if table_key in ['NPU_Pstate', 'NoC_Pstate', 'iGFX_Pstate']:
-            return any('Frequency Bucket (MHz)' in str(key) for key in keys)
-        
-        # For C-state and P-state tables, check if they have proper structure
-        if table_key in ['Core_Cstate', 'ACPI_Cstate', 'PKG_Cstate', 'CPU_Pstate', 'CPU_Pavr']:
-            # Specialized tables don't have generic header patterns like "Component (Unit)"
-            first_key = str(keys[0])
-            
-            # If first key contains generic patterns, it might not be specialized
-            generic_patterns = ['Component', 'State', 'Frequency', 'Residency', 'Time']
-            has_generic_pattern = any(pattern in first_key for pattern in generic_patterns)
-            
-            # If first key has units in parentheses and generic patterns, might not be specialized
-            if has_generic_pattern and '(' in first_key and ')' in first_key:
-                return False
-            
-            # Otherwise, assume it's been specialized
-            return True
-        
-        # For other table types, assume they've been processed by specialized functions
-        # if they don't look like raw CSV headers
-        first_key = str(keys[0])
-        
-        # Raw CSV headers typically have units in parentheses and descriptive names
-        looks_like_raw_header = ('(' in first_key and ')' in first_key and 
-                                any(term in first_key for term in ['Component', 'State', 'Frequency', 'Residency', 'Percentage']))
-        
-        # If it looks like a raw header, it probably wasn't specialized
-        return not looks_like_raw_header
-    
-    def _get_table_header_text(self, table_key: str, target_info: Dict[str, Any], table_data: Dict[str, Any]) -> str:
-        """Get appropriate table header text based on table type."""
-        # Map table keys to their header descriptions based on sample Excel
-        header_mapping = {
-            'CPU_model': 'CPU_model',
-            'PCH_SLP50': 'PCH SLP-S0 States',
-            'S0ix_Substate': 'State',
-            'PKG_Cstate': 'C-State',
-            'Core_Cstate': 'C-State',
-            'Core_Concurrency': '# Active Cores',
-            'ACPI_Cstate': 'C-State',
-            'OS_wakeups': 'OS_wakeups',
-            'CPU-iGPU': 'CPU/Package_0 Residency (%)',
-            'CPU_Pavr': 'CPU ID',
-            'CPU_Pstate': 'P-State',
-            'RC_Cstate': 'C-State',
-            'DDR_BW': 'DDR_BW_AvrRt(MB/s)',
-            'IO_BW': 'IO_BW_AvrRt(MB/s)',
-            'VC1_BW': 'VC1_BW_AvrRt(MB/s)',
-            'NPU_BW': 'NPU_BW_AvrRt(MB/s)',
-            'Media_BW': 'Media_BW_AvrRt(MB/s)',
-            'IPU_BW': 'IPU_BW_AvrRt(MB/s)',
-            'CCE_BW': 'CCE_BW_AvrRt(MB/s)',
-            'GT_BW': 'GT_BW_AvrRt(MB/s)',
-            'D2D_BW': 'D2D_BW_AvrRt(MB/s)',
-            'CPU_temp': 'Component Name',
-            'SoC_temp': 'Component Name',
-            'NPU_Dstate': 'State',
-            'PMC+SLP_S0': 'PCH IP Blocks',
-            'Media_Cstate': 'C-State',
-            'NPU_Pstate': 'Frequency (MHz)',
-            'MEMSS_Pstate': 'Frequency (MHz)',
-            'NoC_Pstate': 'Frequency (MHz)',
-            'iGFX_Pstate': 'Frequency (MHz)'
-        }
+        first_key = str(next(iter(table_data)))
         
-        return header_mapping.get(table_key, table_key)
+        # Bandwidth tables share one check; everything else dispatches on its key
+        if table_key.endswith(_BW_SUFFIX):
+            check = _is_specialized_bw
+        else:
+            check = _SPECIALIZED_CHECKS.get(table_key, _is_specialized_other)
+        return check(table_data, table_key, first_key)
     
-    def _get_table_header_value(self, table_key: str, table_data: Dict[str, Any]) -> str:
-        """Get appropriate table header value based on table type."""
-        # Map table keys to their header values based on sample Excel
-        value_mapping = {
-            'CPU_model': 'CPU_model',
-            'PCH_SLP50': 'PCH Residency (%)',
-            'S0ix_Substate': 'Residency (%)',
-            'PKG_Cstate': 'Package Residency ()',
-            'Core_Cstate': 'CPU/Package_0/Core_0 Residency ()',
-            'Core_Concurrency': 'Time Active (%)',
-            'ACPI_Cstate': 'CPU/Package_0/Core_0 Residency ()',
-            'OS_wakeups': 'Process Name (PID) (CPU % (Platform))',
-            'CPU-iGPU': 'CPU/Package_0 Residency (%)',
-            'CPU_Pavr': 'Average (MHz)',
-            'CPU_Pstate': 'Frequency (MHz)',
-            'RC_Cstate': 'iGPU/Graphics Residency ()',
-            'CPU_temp': 'Time-weighted Avg (oC)',
-            'SoC_temp': 'Time-weighted Avg (oC)',
-            'NPU_Dstate': 'Residency (%)',
-            'PMC+SLP_S0': 'Description',
-            'Media_Cstate': 'Residency ()',
-            'NPU_Pstate': 'NPU (%)',
-            'MEMSS_Pstate': 'MEMSS (%)',
-            'NoC_Pstate': 'NoC (%)',
-            'iGFX_Pstate': 'iGFX (%)'
-        }
+    def _get_table_header_pair(self, table_key: str, target_info: Dict[str, Any],
+                               table_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """Get the table header text and value based on table type."""
+        header_text = _HEADER_TEXT_MAP.get(table_key, table_key)
         
-        # For bandwidth tables, return the actual value
-        if table_key.endswith('_BW'):
-            return next(iter(table_data.values())) if table_data else '0.00'
+        # For bandwidth tables, the header value is the actual value
+        if table_key.endswith(_BW_SUFFIX):
+            return header_text, next(iter(table_data.values()), '0.00')
         
-        return value_mapping.get(table_key, 'Value')
+        return header_text, _HEADER_VALUE_MAP.get(table_key, 'Value')
     
     def validate_data(self, data: Dict[str, Any]) -> bool:
         """Validate parsed Socwatch data."""
@@ -877,45 +1034,30 @@ class PCIeParser(BaseParser):
         if file_path.suffix.lower() != '.csv':
             return False
         
-        # Get the parent folder
-        parent_folder = file_path.parent
         filename = file_path.name
         
         # Skip WakeupAnalysis files
         if 'wakeupanalysis' in filename.lower():
             return False
         
-        # Check for Socwatch ETL files in the same folder
-        required_etl_files = [
-            '_extraSession.etl',
-            '_hwSession.etl', 
-            '_infoSession.etl'
-        ]
-        
-        # Check if required ETL files exist but _osSession.etl is missing
-        etl_files_found = []
-        workload_prefix = None
-        has_os_session = False
+        # Parent folder as a plain string, used for both the stat and the cache key;
+        # a folder that does not exist cannot hold the session ETL files
+        parent_folder = os.fspath(file_path.parent)
+        try:
+            folder_mtime_ns = os.stat(parent_folder).st_mtime_ns
+        except OSError:
+            return False
         
-        for etl_file in parent_folder.glob('*.etl'):
-            etl_name = etl_file.name
-            
-            # Check for _osSession.etl
-            if etl_name.endswith('_osSession.etl'):
-                has_os_session = True
-            
-            # Check for other required ETL files
-            for required_suffix in required_etl_files:
-                if etl_name.endswith(required_suffix):
-                    etl_files_found.append(required_suffix)
-                    # Extract workload prefix
-                    workload_prefix = etl_name.replace(required_suffix, '')
-                    break
+        # Check for Socwatch ETL files in the same folder
+        # (_extraSession, _hwSession and _infoSession required, _osSession must be absent)
+        workload_prefix, etl_sessions_found, has_os_session = _scan_etl_dir(
+            parent_folder, folder_mtime_ns
+        )
         
         # Must have the 3 required ETL files but NOT _osSession.etl
-        if len(set(etl_files_found)) >= 3 and not has_os_session:
-            # Check if this CSV file matches the workload prefix
-            if workload_prefix and filename.startswith(workload_prefix) and filename.endswith('.csv'):
+        if len(etl_sessions_found) >= 3 and not has_os_session:
+            # Check if this CSV file matches the workload prefix (the .csv suffix was checked above)
+            if workload_prefix and filename.startswith(workload_prefix):
                 return True
         
         return False
@@ -925,7 +1067,7 @@ class PCIeParser(BaseParser):
         try:
             self.logger.info(f"Parsing PCIe Socwatch file: {file_path}")
             
-            # Read the CSV file as text to extract PCIe-specific data
+            # Read the CSV file to extract PCIe-specific data
             with open(file_path, 'r', encoding=self.encoding) as f:
                 content = f.read()
             
@@ -952,9 +1094,8 @@ class PCIeParser(BaseParser):
             raise ParsingError(f"Failed to parse PCIe data from {file_path}: {str(e)}")
     
     def _extract_pcie_metrics(self, content: str) -> Dict[str, Any]:
-        """Extract PCIe-specific metrics from content using config targets."""
-        from collections import OrderedDict
-        pcie_data = OrderedDict()
+        """Extract PCIe-specific metrics from file content using config targets."""
+        pcie_data = {}
         
         # Load PCIe targets from config
         pcie_targets = self._load_pcie_targets()
@@ -963,33 +1104,31 @@ class PCIeParser(BaseParser):
             self.logger.warning("No PCIe targets defined in config")
             return {}
         
-        lines = content.split('\n')
+        # Locate every lookup text in one pass over the file
+        lookup_offsets = _find_lookup_offsets(content, [target['lookup'] for target in pcie_targets])
         
         # Process each PCIe target
         for target in pcie_targets:
             lookup_text = target['lookup']
-            target_key = target['key']
+            target_key = sys.intern(target['key'])
             devices = target.get('devices', [])
             
             # Find the lookup text in the file
-            table_start_idx = -1
-            for i, line in enumerate(lines):
-                if lookup_text in line:
-                    table_start_idx = i
-                    break
+            table_start = lookup_offsets.get(lookup_text, -1)
             
-            if table_start_idx == -1:
+            if table_start == -1:
                 self.logger.debug(f"PCIe table lookup '{lookup_text}' not found for {target_key}")
                 continue
             
             # Extract table data starting after the lookup line
-            table_data = self._extract_pcie_table_data(lines, table_start_idx, target, devices)
+            table_data = self._extract_pcie_table_data(content, table_start, target, devices)
             
             if table_data:
                 # Flatten the data for Excel reporting with proper grouping
-                for metric_key, metric_value in table_data.items():
-                    data_key = f"{metric_key}        {target_key}"
-                    pcie_data[data_key] = metric_value
+                key_suffix = _METRIC_KEY_SEP + target_key
+                pcie_data.update(
+                    (metric_key + key_suffix, metric_value) for metric_key, metric_value in table_data.items()
+                )
                     
                 self.logger.debug(f"Extracted {len(table_data)} entries for PCIe {target_key}")
         
@@ -998,13 +1137,10 @@ class PCIeParser(BaseParser):
     def _load_pcie_targets(self) -> List[Dict[str, Any]]:
         """Load PCIe targets from config."""
         try:
-            from pathlib import Path
-            import json
-            
-            config_path = Path('config/pcie_targets_default.json')
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    return json.load(f)
+            config_path = os.path.abspath('config/pcie_targets_default.json')
+            if os.path.exists(config_path):
+                mtime_ns = os.stat(config_path).st_mtime_ns
+                return list(_load_targets_file(config_path, mtime_ns))
             else:
                 self.logger.warning("PCIe config not found, using default targets")
                 return self._get_default_pcie_targets()
@@ -1020,34 +1156,12 @@ class PCIeParser(BaseParser):
             {"key": "PCIe_LTRsnoop", "devices": ["NVM"], "lookup": "PCIe LTR Snoop Summary - Sampled: Histogram"}
         ]
     
-    def _extract_pcie_table_data(self, lines: List[str], lookup_idx: int, target: Dict[str, Any], devices: List[str]) -> Dict[str, Any]:
+    def _extract_pcie_table_data(self, content: str, lookup_offset: int, target: Dict[str, Any], devices: List[str]) -> Dict[str, Any]:
         """Extract PCIe table data using device-specific parsing."""
         target_key = target['key']
         
-        # Start from the line after the lookup text
-        current_idx = lookup_idx + 1
-        
-        # Collect raw table lines until empty line or end of file
-        raw_table_lines = []
-        while current_idx < len(lines):
-            line = lines[current_idx].strip()
-            
-            # Empty line marks end of table
-            if not line:
-                break
-            
-            # Skip separator lines (only dashes)
-            if line.startswith('---') or line.replace('-', '').replace(' ', '') == '':
-                current_idx += 1
-                continue
-            
-            # Add line to raw table data
-            # Split by comma and clean up each part
-            parts = [part.strip().strip('"') for part in line.split(',') if part.strip()]
-            if parts:  # Only add non-empty rows
-                raw_table_lines.append(parts)
-            
-            current_idx += 1
+        # Collect raw table rows starting from the line after the lookup text
+        raw_table_lines = _read_table_block(content, lookup_offset)
         
         # If no table data found, return empty dict
         if not raw_table_lines:
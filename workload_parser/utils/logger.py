@@ -5,7 +5,7 @@ Logging utilities for the workload parser.
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 try:
     from rich.console import Console
@@ -14,6 +14,11 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+__all__ = ['setup_logging', 'get_logger']
+
+# Handlers added by the last setup_logging call; only these are closed on the next one
+_installed_handlers: List[logging.Handler] = []
+
 
 def setup_logging(config) -> None:
     """Setup logging configuration."""
@@ -30,11 +35,17 @@ def setup_logging(config) -> None:
         console = getattr(config, 'console', True)
         file_path = getattr(config, 'file_path', None)
     
+    # Resolve the level name once for the root logger and its handlers
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    
     # Create logger
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    logger.setLevel(log_level)
     
-    # Clear existing handlers
+    # Clear existing handlers, closing the ones installed here so their files are released
+    for handler in _installed_handlers:
+        handler.close()
+    _installed_handlers.clear()
     logger.handlers.clear()
     
     # Create formatter
@@ -52,8 +63,9 @@ def setup_logging(config) -> None:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(formatter)
         
-        console_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
+        console_handler.setLevel(log_level)
         logger.addHandler(console_handler)
+        _installed_handlers.append(console_handler)
     
     # Setup file handler if specified
     if file_path:
@@ -62,8 +74,9 @@ def setup_logging(config) -> None:
         
         file_handler = logging.FileHandler(file_path_obj, encoding='utf-8')
         file_handler.setFormatter(formatter)
-        file_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
+        file_handler.setLevel(log_level)
         logger.addHandler(file_handler)
+        _installed_handlers.append(file_handler)
 
 
 def get_logger(name: str) -> logging.Logger: